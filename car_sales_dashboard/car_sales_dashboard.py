@@ -3,6 +3,7 @@ import reflex as rx
 
 # Import the index page from the pages module
 from car_sales_dashboard.pages import index
+from car_sales_dashboard.state import warm_chart_cache
 
 # Create the app
 app = rx.App()
@@ -10,6 +11,9 @@ app = rx.App()
 # Add the index page to the app
 app.add_page(index, title="Auto Sales Forecast Dashboard")
 
+# Prebuild the unfiltered charts when the server starts
+app.register_lifespan_task(warm_chart_cache)
+
 # Start the app if run directly
 if __name__ == "__main__":
     app.compile()
\ No newline at end of file
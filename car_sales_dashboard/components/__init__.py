@@ -32,7 +32,9 @@ from car_sales_dashboard.components.chart_components import (
 
 from car_sales_dashboard.components.tables import (
     create_summary_table,
-    create_forecast_table
+    create_forecast_table,
+    summarize_sales,
+    format_forecast_rows
 )
 
 # from car_sales_dashboard.components.exogenous_chart import (
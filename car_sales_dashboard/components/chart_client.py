@@ -3,116 +3,54 @@ Client-side chart updater for Car Sales Dashboard.
 
 This module provides client-side effects to update charts after page loads
 to avoid EventHandler errors when directly using state methods in style props.
+
+Note: the app does not import this module. It is written against
+rx.effect and rx.set_custom_value, which the pinned Reflex release
+(0.7.11) does not provide, so importing it raises AttributeError.
 """
 
+from functools import partial
+
 import reflex as rx
 from car_sales_dashboard.state import DashboardState
 
-# Create a client-side effect to update the sales trend chart
-sales_trend_chart_effect = rx.effect(
-    lambda: DashboardState.get_sales_trend_chart(),
-    dependencies=[
-        DashboardState.forecast_data,
-        DashboardState.active_tab
-    ],
-    handler=lambda result: rx.set_custom_value(
-        id="sales-trend-chart",
-        attribute="plotly_figure",
-        value=result
-    )
-)
+# Chart element id and the chart var that fills it
+CHART_EFFECTS = [
+    ("sales-trend-chart", DashboardState.get_sales_trend_chart),
+    ("vehicle-type-chart", DashboardState.get_vehicle_type_chart),
+    ("top-models-chart", DashboardState.get_top_models_chart),
+    ("sales-by-month-chart", DashboardState.get_sales_by_month_chart),
+    ("region-chart", DashboardState.get_region_chart),
+    ("state-map-chart", DashboardState.get_state_map_chart),
+    ("exogenous-impact-chart", DashboardState.get_exogenous_impact_chart),
+]
 
-# Create a client-side effect to update the vehicle type chart
-vehicle_type_chart_effect = rx.effect(
-    lambda: DashboardState.get_vehicle_type_chart(),
-    dependencies=[
-        DashboardState.filtered_data,
-        DashboardState.active_tab
-    ],
-    handler=lambda result: rx.set_custom_value(
-        id="vehicle-type-chart",
-        attribute="plotly_figure",
-        value=result
-    )
-)
 
-# Create a client-side effect to update the top models chart
-top_models_chart_effect = rx.effect(
-    lambda: DashboardState.get_top_models_chart(),
-    dependencies=[
-        DashboardState.filtered_data,
-        DashboardState.active_tab
-    ],
-    handler=lambda result: rx.set_custom_value(
-        id="top-models-chart",
+def _set_chart_figure(chart_id, result):
+    """Push an updated figure into a chart element"""
+    return rx.set_custom_value(
+        id=chart_id,
         attribute="plotly_figure",
         value=result
     )
-)
 
-# Create a client-side effect to update the sales by month chart
-sales_by_month_chart_effect = rx.effect(
-    lambda: DashboardState.get_sales_by_month_chart(),
-    dependencies=[
-        DashboardState.filtered_data,
-        DashboardState.active_tab
-    ],
-    handler=lambda result: rx.set_custom_value(
-        id="sales-by-month-chart",
-        attribute="plotly_figure",
-        value=result
-    )
-)
-
-# Create a client-side effect to update the region chart
-region_chart_effect = rx.effect(
-    lambda: DashboardState.get_region_chart(),
-    dependencies=[
-        DashboardState.filtered_data,
-        DashboardState.active_tab
-    ],
-    handler=lambda result: rx.set_custom_value(
-        id="region-chart",
-        attribute="plotly_figure",
-        value=result
-    )
-)
 
-# Create a client-side effect to update the state map chart
-state_map_chart_effect = rx.effect(
-    lambda: DashboardState.get_state_map_chart(),
-    dependencies=[
-        DashboardState.filtered_data,
-        DashboardState.active_tab
-    ],
-    handler=lambda result: rx.set_custom_value(
-        id="state-map-chart",
-        attribute="plotly_figure",
-        value=result
+def _chart_effect(chart_id, chart_var):
+    """Create a client-side effect that updates one chart element"""
+    # Depend on the chart var itself: it changes whenever its figure does,
+    # whereas filtered_data stays empty unless the data table is shown
+    return rx.effect(
+        chart_var,
+        dependencies=[
+            chart_var,
+            DashboardState.active_tab
+        ],
+        handler=partial(_set_chart_figure, chart_id)
     )
-)
 
-# Create a client-side effect to update the exogenous impact chart
-exogenous_impact_chart_effect = rx.effect(
-    lambda: DashboardState.get_exogenous_impact_chart(),
-    dependencies=[
-        DashboardState.forecast_data,
-        DashboardState.active_tab
-    ],
-    handler=lambda result: rx.set_custom_value(
-        id="exogenous-impact-chart",
-        attribute="plotly_figure",
-        value=result
-    )
-)
 
-# Bundle all effects together for easy import
+# Build all effects once at import, bundled together for easy import
 chart_client_effects = [
-    sales_trend_chart_effect,
-    vehicle_type_chart_effect,
-    top_models_chart_effect,
-    sales_by_month_chart_effect,
-    region_chart_effect,
-    state_map_chart_effect,
-    exogenous_impact_chart_effect,
+    _chart_effect(chart_id, chart_var)
+    for chart_id, chart_var in CHART_EFFECTS
 ]
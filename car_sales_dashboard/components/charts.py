@@ -1,7 +1,12 @@
+import logging
+
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
+import numpy as np
+
+logger = logging.getLogger(__name__)
 
 
 def create_sales_trend_chart(forecast_data):
@@ -17,26 +22,18 @@ def create_sales_trend_chart(forecast_data):
     # Check if data is empty either as DataFrame or list
     if isinstance(forecast_data, pd.DataFrame):
         if forecast_data.empty:
-            print("Forecast data DataFrame is empty")
+            logger.debug("Forecast data DataFrame is empty")
             return {}
     elif not forecast_data:
-        print("Forecast data is None or empty list")
+        logger.debug("Forecast data is None or empty list")
         return {}
     
-    # Additional debug info
-    try:
-        print(f"Forecast data type: {type(forecast_data)}")
-        print(f"Forecast data columns: {forecast_data.columns if hasattr(forecast_data, 'columns') else 'No columns'}")
-        print(f"Forecast data shape: {forecast_data.shape if hasattr(forecast_data, 'shape') else 'No shape'}")
-    except Exception as e:
-        print(f"Error inspecting forecast data: {e}")
-      
     # Create the chart
     fig = go.Figure()
     
     try:
         # Convert to numeric indices for x-axis to avoid text rendering issues
-        forecast_data['x_index'] = range(len(forecast_data))
+        forecast_data = forecast_data.assign(x_index=range(len(forecast_data)))
         
         # Historical sales - with error handling
         if 'is_forecast' in forecast_data.columns:
@@ -51,7 +48,7 @@ def create_sales_trend_chart(forecast_data):
                     line=dict(color='blue', width=2)
                 ))
             else:
-                print("No historical data after filtering")
+                logger.debug("No historical data after filtering")
             
             # Forecasted sales
             forecast = forecast_data[forecast_data['is_forecast'] == True]
@@ -73,14 +70,14 @@ def create_sales_trend_chart(forecast_data):
                         line_color="gray"
                     )
             else:
-                print("No forecast data after filtering")
+                logger.debug("No forecast data after filtering")
                 
             # Create custom tick labels from the date column
             tick_vals = forecast_data['x_index'].tolist()
             tick_text = forecast_data['date'].tolist()
         else:
             # If 'is_forecast' column doesn't exist, just plot all data
-            print("'is_forecast' column not found in data, plotting all as historical")
+            logger.warning("'is_forecast' column not found in data, plotting all as historical")
             fig.add_trace(go.Scatter(
                 x=forecast_data['x_index'],
                 y=forecast_data['sales'],
@@ -92,7 +89,7 @@ def create_sales_trend_chart(forecast_data):
             tick_vals = forecast_data['x_index'].tolist()
             tick_text = forecast_data['date'].tolist() 
     except Exception as e:
-        print(f"Error creating chart traces: {e}")
+        logger.exception("Error creating chart traces: %s", e)
         # Set default tick values if the above code fails
         tick_vals = list(range(12))
         tick_text = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]    # Update layout with improved visibility settings and custom x-axis ticks
@@ -164,7 +161,7 @@ def create_vehicle_type_chart(filtered_data):
         return {}
     
     # Group by vehicle type
-    vehicle_sales = filtered_data.groupby('vehicle_type')['sales'].sum().reset_index()
+    vehicle_sales = filtered_data.groupby('vehicle_type', observed=True)['sales'].sum().reset_index()
     
     # Create pie chart
     fig = px.pie(
@@ -194,7 +191,7 @@ def create_region_chart(filtered_data):
         return {}
     
     # Group by region
-    region_sales = filtered_data.groupby('region')['sales'].sum().reset_index()
+    region_sales = filtered_data.groupby('region', observed=True)['sales'].sum().reset_index()
     
     # Create bar chart
     fig = px.bar(
@@ -315,12 +312,25 @@ def create_top_models_chart(filtered_data):
     if filtered_data.empty:
         return {}
     
-    # Group by make and model
-    model_sales = filtered_data.groupby(['make', 'model'])['sales'].sum().reset_index()
-    model_sales['make_model'] = model_sales['make'] + ' ' + model_sales['model']
-    
-    # Sort and get top 10
-    top_models = model_sales.sort_values('sales', ascending=False).head(10)
+    # Sum sales per make and model pair straight from the categorical codes
+    makes = filtered_data['make'].cat
+    models = filtered_data['model'].cat
+    n_pairs = len(makes.categories) * len(models.categories)
+    pairs = makes.codes.to_numpy(dtype=np.intp) * len(models.categories) + models.codes.to_numpy()
+    pair_sales = np.bincount(pairs, weights=filtered_data['sales'].to_numpy(), minlength=n_pairs)
+    observed = np.flatnonzero(np.bincount(pairs, minlength=n_pairs))
+    
+    # Partition out the top 10 pairs, then sort only those
+    if len(observed) > 10:
+        observed = observed[np.argpartition(-pair_sales[observed], 10)[:10]]
+    top = observed[np.argsort(-pair_sales[observed], kind='stable')]
+    
+    top_models = pd.DataFrame({
+        'make': makes.categories[top // len(models.categories)],
+        'model': models.categories[top % len(models.categories)],
+        'sales': pair_sales[top],
+    })
+    top_models['make_model'] = top_models['make'].astype(str) + ' ' + top_models['model'].astype(str)
     
     # Create bar chart
     fig = px.bar(
@@ -351,7 +361,7 @@ def create_state_map_chart(filtered_data):
         return {}
     
     # Group by state
-    state_sales = filtered_data.groupby('state')['sales'].sum().reset_index()
+    state_sales = filtered_data.groupby('state', observed=True)['sales'].sum().reset_index()
     
     # Create the map
     fig = px.choropleth(
@@ -388,17 +398,21 @@ def create_heatmap_chart(filtered_data, x_col='month', y_col='vehicle_type'):
     if filtered_data.empty:
         return {}
     
-    # Group by specified columns
-    grouped = filtered_data.groupby([y_col, x_col])['sales'].sum().reset_index()
+    # Number the observed values of each axis in sorted order
+    y_codes, y_values = pd.factorize(filtered_data[y_col], sort=True)
+    x_codes, x_values = pd.factorize(filtered_data[x_col], sort=True)
     
-    # Pivot for heatmap format
-    pivot_data = grouped.pivot(index=y_col, columns=x_col, values='sales')
+    # Sum sales into a flat grid of cells, leaving empty cells blank
+    n_cells = len(y_values) * len(x_values)
+    cells = y_codes * len(x_values) + x_codes
+    grid = np.bincount(cells, weights=filtered_data['sales'].to_numpy(), minlength=n_cells)
+    grid[np.bincount(cells, minlength=n_cells) == 0] = np.nan
     
     # Create heatmap
     fig = go.Figure(data=go.Heatmap(
-        z=pivot_data.values,
-        x=pivot_data.columns,
-        y=pivot_data.index,
+        z=grid.reshape(len(y_values), len(x_values)),
+        x=np.asarray(x_values),
+        y=np.asarray(y_values),
         colorscale='Viridis',
         colorbar=dict(title='Sales')
     ))
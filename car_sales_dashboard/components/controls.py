@@ -1,19 +1,12 @@
 import reflex as rx
 
 
-def sidebar_filters(unique_regions, unique_states, unique_vehicle_types, 
-                   unique_makes, unique_models, unique_years, state_class):
+def sidebar_filters(state_class):
     """
     Create sidebar filters for the dashboard
     
     Args:
-        unique_regions (list): List of unique regions
-        unique_states (list): List of unique states
-        unique_vehicle_types (list): List of unique vehicle types
-        unique_makes (list): List of unique makes
-        unique_models (list): List of unique models
-        unique_years (list): List of unique years
-        state_class: State class with update handlers
+        state_class: State class with filter options and update handlers
     
     Returns:
         rx.Component: Sidebar component with filters
@@ -23,7 +16,7 @@ def sidebar_filters(unique_regions, unique_states, unique_vehicle_types,
           # Region filter
         rx.text("Regions:", color="black"),
         rx.select(
-            unique_regions,
+            state_class.region_options,
             placeholder="Select regions",
             on_change=state_class.update_regions,
             is_multi=True,
@@ -33,7 +26,7 @@ def sidebar_filters(unique_regions, unique_states, unique_vehicle_types,
         ),          # State filter
         rx.text("States:", color="black"),
         rx.select(
-            unique_states,
+            state_class.state_options,
             placeholder="Select states",
             on_change=state_class.update_states,
             is_multi=True,
@@ -43,7 +36,7 @@ def sidebar_filters(unique_regions, unique_states, unique_vehicle_types,
         ),          # Vehicle type filter
         rx.text("Vehicle Types:", color="black"),
         rx.select(
-            unique_vehicle_types,
+            state_class.vehicle_type_options,
             placeholder="Select vehicle types",
             on_change=state_class.update_vehicle_types,
             is_multi=True,
@@ -53,7 +46,7 @@ def sidebar_filters(unique_regions, unique_states, unique_vehicle_types,
         ),          # Make filter
         rx.text("Makes:", color="black"),
         rx.select(
-            unique_makes,
+            state_class.make_options,
             color="black",
             bg="white",
             border_color="#CCC",
@@ -64,7 +57,7 @@ def sidebar_filters(unique_regions, unique_states, unique_vehicle_types,
           # Model filter
         rx.text("Models:", color="black"),
         rx.select(
-            unique_models,
+            state_class.model_options,
             placeholder="Select models",
             on_change=state_class.update_models,
             is_multi=True,
@@ -72,7 +65,7 @@ def sidebar_filters(unique_regions, unique_states, unique_vehicle_types,
           # Year filter
         rx.text("Model Years:", color="black"),
         rx.select(
-            unique_years,
+            state_class.year_options,
             placeholder="Select years",
             on_change=state_class.update_years,
             is_multi=True,
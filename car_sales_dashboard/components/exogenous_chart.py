@@ -1,6 +1,8 @@
 """
 Module for creating exogenous variable charts.
 """
+import logging
+
 import reflex as rx
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -8,6 +10,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+logger = logging.getLogger(__name__)
+
 
 def _create_sample_exogenous_figure(title: str):
     """Create a sample exogenous figure with synthetic data when no real data is available.
@@ -16,7 +20,7 @@ def _create_sample_exogenous_figure(title: str):
     Returns:
         plotly.graph_objects.Figure: A plotly figure object
     """
-    print("No forecast data provided, generating sample data for visualization")
+    logger.debug("No forecast data provided, generating sample data for visualization")
 
     # Set last historical date to April 2025
     last_hist_date = pd.Timestamp(year=2025, month=4, day=1)
@@ -48,7 +52,8 @@ def _create_sample_exogenous_figure(title: str):
         'is_forecast': [False] * len(hist_dates) + [True] * len(forecast_dates)
     }
     forecast_data = pd.DataFrame(sample_data)
-    print(f"Generated sample data with {len(forecast_data)} rows, last hist: {date_strs[len(hist_dates)-1]}, first forecast: {date_strs[len(hist_dates)]}")
+    logger.debug("Generated sample data with %d rows, last hist: %s, first forecast: %s",
+                 len(forecast_data), date_strs[len(hist_dates)-1], date_strs[len(hist_dates)])
     return _create_exogenous_figure_from_df(forecast_data, title)
 
 
@@ -57,26 +62,27 @@ def create_exogenous_figure(title: str, forecast_data) -> go.Figure:
 
     Args:
         title: The chart title.
-        forecast_data: List[dict] or DataFrame with exogenous data.
+        forecast_data: List[dict], dict of column lists or DataFrame with
+            exogenous data.
 
     Returns:
         plotly.graph_objects.Figure: The chart.
     """
     # Handle empty or None forecast_data by generating sample data
-    if not forecast_data or (isinstance(forecast_data, list) and len(forecast_data) == 0):
-        print("No forecast data provided, generating sample data for visualization")
+    if forecast_data is None or len(forecast_data) == 0:
+        logger.debug("No forecast data provided, generating sample data for visualization")
         return _create_sample_exogenous_figure(title)
 
-    # Accept both list-of-dicts and DataFrame
-    if isinstance(forecast_data, list):
+    # Accept list-of-dicts, column-major dict and DataFrame
+    if isinstance(forecast_data, (list, dict)):
         df = pd.DataFrame(forecast_data)
     elif isinstance(forecast_data, pd.DataFrame):
         df = forecast_data
     else:
-        raise ValueError("forecast_data must be a list of dicts or a DataFrame.")
+        raise ValueError("forecast_data must be a list of dicts, a dict of lists or a DataFrame.")
 
-    print(f"Creating exogenous chart with {len(df)} rows of data")
-    print(f"Data columns: {df.columns.tolist()}")
+    logger.debug("Creating exogenous chart with %d rows of data", len(df))
+    logger.debug("Data columns: %s", df.columns.tolist())
 
     # (the rest of your existing plotting logic here)
     fig = make_subplots(
@@ -155,7 +161,7 @@ def create_exogenous_figure(title: str, forecast_data) -> go.Figure:
                         row=i, col=j
                     )
     except Exception as e:
-        print(f"Error adding forecast divider: {e}")
+        logger.warning("Error adding forecast divider: %s", e)
     # Layout and grid
     fig.update_layout(
         height=500,
@@ -199,8 +205,8 @@ def _create_exogenous_figure_from_df(forecast_data, title):
         plotly.graph_objects.Figure: A plotly figure object
     """
     # Print info about the data we're plotting
-    print(f"Creating exogenous chart with {len(forecast_data)} rows of data")
-    print(f"Data columns: {forecast_data.columns.tolist()}")
+    logger.debug("Creating exogenous chart with %d rows of data", len(forecast_data))
+    logger.debug("Data columns: %s", forecast_data.columns.tolist())
     
     # Create subplots
     fig = make_subplots(
@@ -216,7 +222,7 @@ def _create_exogenous_figure_from_df(forecast_data, title):
     
     # Check and print available columns for debugging
     available_columns = forecast_data.columns.tolist()
-    print(f"Available columns in forecast_data: {available_columns}")
+    logger.debug("Available columns in forecast_data: %s", available_columns)
     
     # Add unemployment trace if column exists
     if 'date' in available_columns and 'unemployment' in available_columns:
@@ -231,7 +237,7 @@ def _create_exogenous_figure_from_df(forecast_data, title):
             row=1, col=1
         )
     else:
-        print("Warning: 'date' or 'unemployment' column missing")
+        logger.warning("'date' or 'unemployment' column missing")
     
     # Add gas price trace if column exists
     if 'date' in available_columns and 'gas_price' in available_columns:
@@ -246,7 +252,7 @@ def _create_exogenous_figure_from_df(forecast_data, title):
             row=1, col=2
         )
     else:
-        print("Warning: 'date' or 'gas_price' column missing")
+        logger.warning("'date' or 'gas_price' column missing")
     
     # Add CPI trace if column exists
     if 'date' in available_columns and 'cpi_all' in available_columns:
@@ -261,7 +267,7 @@ def _create_exogenous_figure_from_df(forecast_data, title):
             row=2, col=1
         )
     else:
-        print("Warning: 'date' or 'cpi_all' column missing")
+        logger.warning("'date' or 'cpi_all' column missing")
     
     # Add search volume trace if column exists
     if 'date' in available_columns and 'search_volume' in available_columns:
@@ -276,7 +282,7 @@ def _create_exogenous_figure_from_df(forecast_data, title):
             row=2, col=2
         )
     else:
-        print("Warning: 'date' or 'search_volume' column missing")
+        logger.warning("'date' or 'search_volume' column missing")
     
     # Highlight forecast region with a vertical line if forecast data is available
     try:
@@ -294,7 +300,7 @@ def _create_exogenous_figure_from_df(forecast_data, title):
                         row=i, col=j
                     )
     except Exception as e:
-        print(f"Error adding forecast divider: {e}")
+        logger.warning("Error adding forecast divider: %s", e)
       # Update layout
     fig.update_layout(
         height=500,
@@ -3,6 +3,14 @@ import numpy as np
 from datetime import datetime, timedelta
 import os
 
+# Filter columns with only a handful of distinct values
+CATEGORICAL_COLUMNS = ('region', 'state', 'vehicle_type', 'make', 'model', 'model_year')
+
+# Exogenous indicator columns stored in single precision. Sales stays in
+# double precision: it is summed for the summary tables and is the
+# forecast models' training target, where float32 rounding shows up.
+FLOAT_COLUMNS = ('unemployment', 'gas_price', 'cpi_energy', 'cpi_all', 'search_volume')
+
 def generate_sample_data():
     """
     Generate synthetic car sales data with exogenous factors.
@@ -187,6 +195,24 @@ def load_data():
     csv_path = os.path.join(data_dir, 'synthetic_car_sales.csv')
     
     if os.path.exists(csv_path):
-        return pd.read_csv(csv_path, parse_dates=['date'])
+        # Parse straight into the narrow dtypes used below so the casts
+        # after the read have nothing left to convert
+        dtypes = {col: 'float32' for col in FLOAT_COLUMNS}
+        dtypes.update({col: 'category' for col in CATEGORICAL_COLUMNS if col != 'model_year'})
+        df = pd.read_csv(csv_path, parse_dates=['date'], date_format='%Y-%m-%d', dtype=dtypes)
     else:
-        return generate_sample_data()
\ No newline at end of file
+        df = generate_sample_data()
+    
+    # Narrow the count and indicator columns so filter scans move fewer bytes
+    for col in ('year', 'month', 'model_year'):
+        df[col] = pd.to_numeric(df[col], downcast='unsigned')
+    for col in FLOAT_COLUMNS:
+        df[col] = df[col].astype('float32')
+    
+    # Store the low-cardinality filter columns as ordered categoricals with
+    # sorted categories so unique values, isin filters and groupbys work on
+    # small integer codes
+    for col in CATEGORICAL_COLUMNS:
+        df[col] = pd.Categorical(df[col], categories=sorted(df[col].unique()), ordered=True)
+    
+    return df
\ No newline at end of file
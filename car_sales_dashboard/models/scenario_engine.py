@@ -1,10 +1,14 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 from sklearn.linear_model import LinearRegression
 from sklearn.ensemble import RandomForestRegressor
 from abc import ABC, abstractmethod
 
+# Seasonal sales multiplier indexed by calendar month (index 0 unused):
+# higher in spring and at year-end, lower in winter
+SEASONAL_FACTORS = np.array([1.0, 0.8, 0.8, 1.2, 1.2, 1.2, 1.0, 1.0, 1.0, 1.0, 1.0, 1.2, 1.2])
+
 class BaseModel(ABC):
     """Abstract base class for forecasting models"""
     
@@ -121,49 +125,38 @@ class ScenarioEngine:
         last_date = last_values['date']
         
         # Generate future dates
-        future_dates = [last_date + timedelta(days=30*i) for i in range(1, months_ahead+1)]
-        
-        # Create forecast data with modified exogenous variables
-        forecast_data = []
-        
-        for i, date in enumerate(future_dates):
-            # Apply modifiers with increasing effect over time
-            time_factor = 1.0 + (i * 0.05)  # Increase effect over time
-            
-            # Apply modifiers to exogenous variables
-            unemployment = last_values['unemployment'] * unemployment_modifier * time_factor
-            gas_price = last_values['gas_price'] * gas_price_modifier * time_factor
-            cpi = last_values['cpi_all'] * cpi_modifier * time_factor
-            search_volume = last_values['search_volume'] * search_volume_modifier * time_factor
-            
-            # Predict sales using the model
-            features = np.array([[unemployment, gas_price, cpi, search_volume]])
-            predicted_sales = self.model.predict(features)[0]
-            
-            # Add seasonal adjustment
-            month = date.month
-            if month in [3, 4, 5, 11, 12]:  # Spring and year-end
-                predicted_sales *= 1.2
-            elif month in [1, 2]:  # Winter
-                predicted_sales *= 0.8
-            
-            # Create forecast record
-            forecast_data.append({
-                'date': date,
-                'year': date.year,
-                'month': date.month,
-                'sales': predicted_sales,
-                'unemployment': unemployment,
-                'gas_price': gas_price,
-                'cpi_all': cpi,
-                'search_volume': search_volume,
-                'is_forecast': True
-            })
+        future_dates = last_date + pd.to_timedelta(30 * np.arange(1, months_ahead+1), unit='D')
+        future_months = future_dates.month.to_numpy()
+        
+        # Apply modifiers with increasing effect over time, for all months at once
+        time_factor = 1.0 + np.arange(months_ahead) * 0.05
+        modifiers = np.array([unemployment_modifier, gas_price_modifier, cpi_modifier, search_volume_modifier])
+        base = last_values[['unemployment', 'gas_price', 'cpi_all', 'search_volume']].to_numpy(dtype=float)
+        features = base * modifiers * time_factor[:, np.newaxis]
+        
+        # Predict sales for every forecast month in a single model call
+        predicted_sales = self.model.predict(features)
+        
+        # Add seasonal adjustment
+        predicted_sales = predicted_sales * SEASONAL_FACTORS[future_months]
+        
+        # Create forecast records
+        forecast_data = pd.DataFrame({
+            'date': future_dates,
+            'year': future_dates.year.to_numpy(),
+            'month': future_months,
+            'sales': predicted_sales,
+            'unemployment': features[:, 0],
+            'gas_price': features[:, 1],
+            'cpi_all': features[:, 2],
+            'search_volume': features[:, 3],
+            'is_forecast': True
+        })
         
         # Combine historical and forecast data
         combined_data = pd.concat([
             monthly_data, 
-            pd.DataFrame(forecast_data)
+            forecast_data
         ]).reset_index(drop=True)
         
         return combined_data
@@ -178,27 +171,17 @@ class ScenarioEngine:
         Returns:
             pd.DataFrame: Aggregated monthly data
         """
-        # Group by date to get monthly totals/averages
-        monthly_sales = data.groupby('date')['sales'].sum().reset_index()
-        monthly_unemployment = data.groupby('date')['unemployment'].mean().reset_index()
-        monthly_gas_price = data.groupby('date')['gas_price'].mean().reset_index()
-        monthly_cpi = data.groupby('date')['cpi_all'].mean().reset_index()
-        monthly_search = data.groupby('date')['search_volume'].mean().reset_index()
+        # Group by date once to get monthly totals/averages
+        monthly_data = data.groupby('date').agg(
+            sales=('sales', 'sum'),
+            unemployment=('unemployment', 'mean'),
+            gas_price=('gas_price', 'mean'),
+            cpi_all=('cpi_all', 'mean'),
+            search_volume=('search_volume', 'mean'),
+        ).reset_index()
         
         # Extract year and month
-        monthly_sales['year'] = monthly_sales['date'].dt.year
-        monthly_sales['month'] = monthly_sales['date'].dt.month
-        
-        # Create a combined dataset
-        monthly_data = pd.DataFrame({
-            'date': monthly_sales['date'],
-            'year': monthly_sales['year'],
-            'month': monthly_sales['month'],
-            'sales': monthly_sales['sales'],
-            'unemployment': monthly_unemployment['unemployment'],
-            'gas_price': monthly_gas_price['gas_price'],
-            'cpi_all': monthly_cpi['cpi_all'],
-            'search_volume': monthly_search['search_volume']
-        })
+        monthly_data.insert(1, 'year', monthly_data['date'].dt.year)
+        monthly_data.insert(2, 'month', monthly_data['date'].dt.month)
         
         return monthly_data
\ No newline at end of file
@@ -231,39 +231,50 @@ def create_pie_chart(title: str, labels, values, height: str = "400px"):
 
 # This function is now imported from components.exogenous_chart
 
+def _panel(spec):
+    """Create a tab panel from a panel spec, mounted only while its tab is active."""
+    return rx.tabs.content(
+        rx.cond(
+            DashboardState.active_tab == spec["value"],
+            rx.vstack(*spec["children"], width="100%"),
+            rx.fragment(),
+        ),
+        value=spec["value"],
+    )
+
 def create_tabs():
     """Create the tabs component with correct argument ordering"""
     # Prepare some simple data for charts
     # For Sales by Vehicle Type
-    vehicle_type_data = df.groupby('vehicle_type')['sales'].sum().reset_index()
+    vehicle_type_data = df.groupby('vehicle_type', observed=True)['sales'].sum().reset_index()
     vehicle_types = vehicle_type_data['vehicle_type'].tolist()
     vehicle_sales = vehicle_type_data['sales'].tolist()
     
     # For Top Models by Sales
-    model_data = df.groupby('model')['sales'].sum().sort_values(ascending=False).head(10).reset_index()
+    model_data = df.groupby('model', observed=True)['sales'].sum().sort_values(ascending=False).head(10).reset_index()
     top_models = model_data['model'].tolist()
     model_sales = model_data['sales'].tolist()
     
     # For Sales by Region
-    region_data = df.groupby('region')['sales'].sum().reset_index()
+    region_data = df.groupby('region', observed=True)['sales'].sum().reset_index()
     regions = region_data['region'].tolist()
     region_sales = region_data['sales'].tolist()
+    
+    # For Sales by State
+    state_data = df.groupby('state', observed=True)['sales'].sum().nlargest(10)
       # Generate mock forecast data if needed
     months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
     sales_trend = [150000, 160000, 155000, 175000, 190000, 180000, 195000, 205000, 215000, 230000, 220000, 240000]
     forecast_values = [250000, 260000, 270000, 265000, 280000, 290000]
     
-    return rx.tabs.root(
-        # All positional arguments first
-        rx.tabs.list(
-            rx.tabs.trigger("Sales Forecast", value="sales", color="black"),
-            rx.tabs.trigger("Vehicle Analysis", value="vehicles", color="black"),
-            rx.tabs.trigger("Geographic", value="geographic", color="black"),
-            rx.tabs.trigger("Economic Factors", value="economic", color="black"),
-        ),
-        rx.tabs.content(
-            rx.vstack(
-                create_line_chart("Sales Trend and Forecast", months, sales_trend, forecast_values, height="500px"),rx.box(height="20px"),  # Add space between chart and controls
+    # One spec per tab: the trigger label, the tab value and the panel children
+    panel_specs = [
+        {
+            "label": "Sales Forecast",
+            "value": "sales",
+            "children": [
+                create_line_chart("Sales Trend and Forecast", months, sales_trend, forecast_values, height="500px"),
+                rx.box(height="20px"),  # Add space between chart and controls
                 rx.hstack(
                     rx.switch(
                         on_change=DashboardState.toggle_table,
@@ -273,18 +284,19 @@ def create_tabs():
                     margin_top="2em",
                     margin_bottom="1em",
                     padding="0.5em",
-                ),                # Use rx.cond for more reliable conditonal rendering
+                ),
+                # Use rx.cond for more reliable conditonal rendering
                 rx.cond(
                     DashboardState.show_table,
-                    create_forecast_table(DashboardState.forecast_data),
+                    create_forecast_table(forecast_data=DashboardState.forecast_table_rows),
                     rx.text("")  # Empty placeholder when table is hidden
                 ),
-                width="100%",
-            ),
-            value="sales",
-        ),
-        rx.tabs.content(
-            rx.vstack(
+            ],
+        },
+        {
+            "label": "Vehicle Analysis",
+            "value": "vehicles",
+            "children": [
                 rx.hstack(
                     create_simple_bar_chart("Sales by Vehicle Type", vehicle_types, vehicle_sales),
                     create_simple_bar_chart("Top Models by Sales", top_models, model_sales),
@@ -293,7 +305,8 @@ def create_tabs():
                 # Create a heatmap-like display as a plain table for simplicity
                 rx.box(
                     rx.heading("Sales by Month and Vehicle Type", color="black", size="4"),
-                    rx.text("Month by vehicle type breakdown", padding="1em"),                    width="100%",
+                    rx.text("Month by vehicle type breakdown", padding="1em"),
+                    width="100%",
                     padding="1.5em",
                     background="white",
                     border_radius="md",
@@ -301,23 +314,23 @@ def create_tabs():
                     margin_top="1.5em",
                     margin_bottom="1.5em",
                 ),
-                width="100%",
-            ),
-            value="vehicles",
-        ),
-        rx.tabs.content(
-            rx.vstack(
+            ],
+        },
+        {
+            "label": "Geographic",
+            "value": "geographic",
+            "children": [
                 create_simple_bar_chart("Sales by Region", regions, region_sales),
                 create_pie_chart("Sales by State", 
-                                 df.groupby('state')['sales'].sum().nlargest(10).index.tolist(),
-                                 df.groupby('state')['sales'].sum().nlargest(10).values.tolist(),
+                                 state_data.index.tolist(),
+                                 state_data.values.tolist(),
                                  height="500px"),
-                width="100%",
-            ),
-            value="geographic",
-        ),
-        rx.tabs.content(
-            rx.vstack(
+            ],
+        },
+        {
+            "label": "Economic Factors",
+            "value": "economic",
+            "children": [
                 # Use the state method directly to ensure reactivity
                 rx.box(
                     rx.heading("Exogenous Variable Trends", color="black", size="4"),
@@ -325,43 +338,20 @@ def create_tabs():
                         rx.plotly(data=DashboardState.get_exogenous_figure),
                         height="500px",
                         width="100%",
-                        ),
-                        width="100%",
-                        padding="1.5em",
-                        background="white",
-                        border_radius="md",
-                        border="1px solid #EEE",
-                        margin_top="1.5em",
-                        margin_bottom="1.5em",
                     ),
+                    width="100%",
+                    padding="1.5em",
+                    background="white",
+                    border_radius="md",
+                    border="1px solid #EEE",
+                    margin_top="1.5em",
+                    margin_bottom="1.5em",
+                ),
                 rx.box(
-                    # Use a simple static component for the summary table
-                    rx.table.root(
-                        rx.table.header(
-                            rx.table.row(
-                                rx.table.column_header_cell("Vehicle Type", color="black", font_weight="bold"),
-                                rx.table.column_header_cell("Total Sales", color="black", font_weight="bold"),
-                                rx.table.column_header_cell("Count", color="black", font_weight="bold")
-                            )
-                        ),
-                        rx.table.body(
-                            rx.table.row(
-                                rx.table.cell("Sedan", color="black"),
-                                rx.table.cell("1,250,000", color="black"),
-                                rx.table.cell("125", color="black")
-                            ),
-                            rx.table.row(
-                                rx.table.cell("SUV", color="black"),
-                                rx.table.cell("950,000", color="black"),
-                                rx.table.cell("95", color="black")
-                            ),
-                            rx.table.row(
-                                rx.table.cell("Truck", color="black"),
-                                rx.table.cell("675,000", color="black"),
-                                rx.table.cell("67", color="black")
-                            )
-                        ),
-                        width="100%",
+                    # Vehicle type summary aggregated by the state on each filter change
+                    create_summary_table(
+                        data=DashboardState.vehicle_type_summary,
+                        groupby_col="vehicle_type",
                     ),
                     width="100%",
                     padding="1em", 
@@ -370,10 +360,19 @@ def create_tabs():
                     border="1px solid #EEE",
                     margin_top="1em",
                 ),
-                width="100%",
-            ),
-            value="economic",
+            ],
+        },
+    ]
+    
+    return rx.tabs.root(
+        # All positional arguments first
+        rx.tabs.list(
+            *[
+                rx.tabs.trigger(spec["label"], value=spec["value"], color="black")
+                for spec in panel_specs
+            ],
         ),
+        *[_panel(spec) for spec in panel_specs],
         # Then all keyword arguments
         on_change=DashboardState.update_active_tab,
         default_value="sales",
@@ -1,10 +1,16 @@
+import asyncio
+import functools
+import json
+import logging
+
 import reflex as rx
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
 
 from car_sales_dashboard.components.exogenous_chart import create_exogenous_figure
 from car_sales_dashboard.models import load_data, ScenarioEngine
-from pydantic import PrivateAttr
 from car_sales_dashboard.components import (
     create_sales_trend_chart,
     create_vehicle_type_chart,
@@ -13,22 +19,292 @@ from car_sales_dashboard.components import (
     create_top_models_chart,
     create_state_map_chart,
     create_heatmap_chart,
+    format_forecast_rows,
+    summarize_sales,
 )
 
+logger = logging.getLogger(__name__)
+
 # Load data
 df = load_data()
 
+# No active filters: one empty selection per filter column
+NO_FILTERS = (frozenset(),) * 6
+
+# Tabs that display the forecast; other tabs only need the filtered data
+FORECAST_TABS = ('sales', 'economic')
+
+# Most filtered rows sent to the client as records
+FILTERED_ROWS_LIMIT = 500
+
+# Quiet period after the last slider event before the forecast is rebuilt
+FORECAST_DEBOUNCE_SECONDS = 0.15
+
+# Columns matched by each entry of a filter key, in key order
+FILTER_COLUMNS = ('region', 'state', 'vehicle_type', 'make', 'model', 'model_year')
+
+# Packed bitmap of matching rows (8 rows per byte) for every value of every
+# filter column, so a selection only ORs and ANDs a few small arrays
+FILTER_BITMAPS = {
+    col: {
+        value: np.packbits(df[col].cat.codes.to_numpy() == code)
+        for code, value in enumerate(df[col].cat.categories)
+    }
+    for col in FILTER_COLUMNS
+}
+
+_NO_ROWS = np.zeros((len(df) + 7) // 8, dtype=np.uint8)
+
+
+def _to_records(frame):
+    """
+    Convert a DataFrame to a list of row dicts
+    
+    Same result as frame.to_dict("records"), but converts each column to
+    Python values in one tolist() call and zips the rows together.
+    
+    Args:
+        frame (pd.DataFrame): Frame to convert
+    
+    Returns:
+        list: One dict per row, keyed by column name
+    """
+    columns = list(frame.columns)
+    return [
+        dict(zip(columns, row))
+        for row in zip(*(frame[col].tolist() for col in columns))
+    ]
+
+
+@functools.lru_cache(maxsize=8)
+def _filter_frame(filter_key):
+    """
+    Filter the loaded data for a filter key
+    
+    Args:
+        filter_key (tuple): Sets of selected regions, states, vehicle types,
+            makes, models and years, as returned by DashboardState._get_filter_key
+    
+    Returns:
+        pd.DataFrame: Rows matching every active filter. This is df itself
+            when nothing is filtered out, and is shared through the caches,
+            so callers must not modify it in place
+    """
+    # Without any active filter every row matches, so skip the scan entirely
+    if not any(filter_key):
+        return df
+    
+    # Combine every active filter into a single bitmap so df is indexed once
+    packed = None
+    
+    for col, selected in zip(FILTER_COLUMNS, filter_key):
+        if not selected:
+            continue
+        
+        # A row passes a column's filter if it holds any of the selected values
+        bitmaps = FILTER_BITMAPS[col]
+        col_bits = np.bitwise_or.reduce([bitmaps.get(value, _NO_ROWS) for value in selected])
+        packed = col_bits if packed is None else packed & col_bits
+    
+    mask = np.unpackbits(packed, count=len(df)).view(bool)
+    
+    # Only materialize a new frame when the filters actually drop rows, and
+    # gather them by position rather than aligning a boolean mask
+    if mask.all():
+        return df
+    return df.take(np.flatnonzero(mask))
+
+
+# Every column the filtered-data charts group sales by
+CHART_DIMENSIONS = ['vehicle_type', 'region', 'state', 'make', 'model', 'month']
+
+
+@functools.lru_cache(maxsize=8)
+def _chart_aggregate(filter_key):
+    """
+    Total the filtered sales over every chart dimension in a single pass
+    
+    Each chart regroups this much smaller frame instead of scanning the
+    filtered rows again, which gives the same sums.
+    
+    Args:
+        filter_key (tuple): Filter selections to aggregate
+    
+    Returns:
+        pd.DataFrame: Sales summed per combination of CHART_DIMENSIONS
+    """
+    data = _filter_frame(filter_key)
+    return data.groupby(CHART_DIMENSIONS, observed=True)['sales'].sum().reset_index()
+
+
+# Charts built only from the filtered rows, keyed by name
+FILTERED_CHARTS = {
+    'vehicle_type': create_vehicle_type_chart,
+    'region': create_region_chart,
+    'top_models': create_top_models_chart,
+    'state_map': create_state_map_chart,
+    'sales_by_month': lambda data: create_heatmap_chart(data, x_col='month', y_col='vehicle_type'),
+}
+
+
+def _json_figure(figure):
+    """
+    Convert a Plotly figure dictionary to plain JSON types
+    
+    Cached figures are resent on every state update, so doing the NumPy to
+    JSON conversion once here leaves only plain lists and dicts to serialize.
+    
+    Args:
+        figure (dict): Plotly figure as a dictionary
+    
+    Returns:
+        dict: The same figure holding only JSON-native values
+    """
+    if not figure:
+        return {}
+    return json.loads(pio.to_json(figure, validate=False))
+
+
+@functools.lru_cache(maxsize=16 * len(FILTERED_CHARTS))
+def _filtered_chart(name, filter_key):
+    """
+    Build a filtered-data chart, memoized on the filter key
+    
+    Args:
+        name (str): Key into FILTERED_CHARTS
+        filter_key (tuple): Filter selections the chart is built for
+    
+    Returns:
+        dict: Plotly figure as a dictionary
+    """
+    data = _chart_aggregate(filter_key)
+    if data.empty:
+        return {}
+    return _json_figure(FILTERED_CHARTS[name](data))
+
+
+@functools.lru_cache(maxsize=32)
+def _train_engine(filter_key, model_type):
+    """
+    Train a scenario engine on the data for a filter key
+    
+    Args:
+        filter_key (tuple): Filter selections to train on
+        model_type (str): Type of model to use ("linear" or "forest")
+    
+    Returns:
+        ScenarioEngine: Engine trained on the filtered data, left untrained
+            when no rows match the filters
+    """
+    engine = ScenarioEngine(model_type=model_type)
+    data = _filter_frame(filter_key)
+    if not data.empty:
+        engine.train(data)
+    return engine
+
+
+@functools.lru_cache(maxsize=32)
+def _forecast_frame(filter_key, model_type, unemployment_modifier, gas_price_modifier,
+                    cpi_modifier, search_volume_modifier, months_ahead):
+    """
+    Forecast sales for a filter key and set of scenario modifiers
+    
+    The returned frame is shared between callers and must not be modified.
+    
+    Returns:
+        pd.DataFrame: Combined historical and forecast data
+    """
+    return _train_engine(filter_key, model_type).forecast(
+        _filter_frame(filter_key),
+        unemployment_modifier=unemployment_modifier,
+        gas_price_modifier=gas_price_modifier,
+        cpi_modifier=cpi_modifier,
+        search_volume_modifier=search_volume_modifier,
+        months_ahead=months_ahead
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _vehicle_type_summary(filter_key):
+    """
+    Summarize sales by vehicle type, memoized on the filter key
+    
+    Args:
+        filter_key (tuple): Filter selections the summary is built for
+    
+    Returns:
+        list: Summary table rows as returned by summarize_sales
+    """
+    return summarize_sales(_filter_frame(filter_key), 'vehicle_type')
+
+
+# Charts built from the forecast, keyed by name
+FORECAST_CHARTS = {
+    'sales_trend': create_sales_trend_chart,
+    'exogenous_impact': create_exogenous_impact_chart,
+}
+
+
+@functools.lru_cache(maxsize=16 * len(FORECAST_CHARTS))
+def _forecast_chart(name, forecast_key):
+    """
+    Build a forecast chart, memoized on the forecast inputs
+    
+    Args:
+        name (str): Key into FORECAST_CHARTS
+        forecast_key (tuple): Arguments the forecast was generated with
+    
+    Returns:
+        dict: Plotly figure as a dictionary
+    """
+    data = _forecast_frame(*forecast_key)
+    if data.empty:
+        return {}
+    return _json_figure(FORECAST_CHARTS[name](data))
+
+
+@functools.lru_cache(maxsize=16)
+def _exogenous_figure(forecast_key):
+    """
+    Build the exogenous variable figure, memoized on the forecast inputs
+    
+    Args:
+        forecast_key (tuple): Arguments the forecast was generated with
+    
+    Returns:
+        go.Figure: Exogenous variable trends for the forecast
+    """
+    return create_exogenous_figure("Exogenous Variable Trends", _forecast_frame(*forecast_key))
+
+
+def warm_chart_cache():
+    """
+    Build the unfiltered charts so the first page load finds them cached
+    
+    Registered as an app lifespan task, so it runs once when the server
+    starts, before it handles the first request, rather than whenever
+    state.py is imported (e.g. by reflex export).
+    """
+    for name in FILTERED_CHARTS:
+        _filtered_chart(name, NO_FILTERS)
+
 
 class DashboardState(rx.State):
     """State for the dashboard application"""
     
-    # Data states stored as JSON-serializable lists
-    filtered_data: list[dict] = df.to_dict("records")
-    forecast_data: list[dict] = []
+    # Data states stored as JSON-serializable lists; the forecast is kept
+    # column-major, one list per column
+    forecast_data: dict[str, list] = {}
+    vehicle_type_summary: list[dict] = _vehicle_type_summary(NO_FILTERS)
 
-    # Private DataFrame storage
-    _filtered_df: pd.DataFrame = PrivateAttr(default=df)
-    _forecast_df: pd.DataFrame = PrivateAttr(default_factory=pd.DataFrame)
+    # Backend vars read before on_load take plain defaults, since Reflex
+    # does not resolve PrivateAttr ones
+    _forecast_df: pd.DataFrame = pd.DataFrame()
+    _filter_key: tuple = NO_FILTERS
+    _forecast_key: tuple = ()
+    _forecast_dirty: bool = True
+    _forecast_pending: int = 0
+    _has_data: bool = not df.empty
     
     # Filter states
     selected_regions: list = []
@@ -38,9 +314,16 @@ class DashboardState(rx.State):
     selected_models: list = []
     selected_years: list = []
     
+    # Filter options, computed once from the loaded data
+    region_options: list[str] = df['region'].cat.categories.tolist()
+    state_options: list[str] = df['state'].cat.categories.tolist()
+    vehicle_type_options: list[str] = df['vehicle_type'].cat.categories.tolist()
+    make_options: list[str] = df['make'].cat.categories.tolist()
+    model_options: list[str] = df['model'].cat.categories.tolist()
+    year_options: list[str] = [str(year) for year in df['model_year'].cat.categories]
+    
     # Model states
     model_type: str = "Linear Regression"
-    _scenario_engine: ScenarioEngine = PrivateAttr()
     
     # Exogenous variable states
     unemployment_modifier: float = 1.0
@@ -53,103 +336,95 @@ class DashboardState(rx.State):
     show_table: bool = False
     active_tab: str = "sales"
     
-    # Initialize when page loads
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Initialize the scenario engine
-        self._scenario_engine = ScenarioEngine(model_type="linear")
-    
     def on_load(self):
         """Called when the page loads"""
         self.filter_data()
         self.train_model()
         self.generate_forecast()
     
+    def _get_filter_key(self):
+        """Get a hashable key for the current filter selections"""
+        # Selections are sets: the order values were picked in and repeated
+        # values do not change the filtered rows or their cache entries
+        return (
+            frozenset(self.selected_regions or ()),
+            frozenset(self.selected_states or ()),
+            frozenset(self.selected_vehicle_types or ()),
+            frozenset(self.selected_makes or ()),
+            frozenset(self.selected_models or ()),
+            frozenset(self.selected_years or ()),
+        )
+    
+    def _get_model_type(self):
+        """Get the scenario engine model type for the selected model"""
+        return "linear" if self.model_type == "Linear Regression" else "forest"
+    
     def filter_data(self):
         """Filter data based on selections"""
-        filtered = df.copy()
-        
-        # Apply region filter
-        if self.selected_regions:
-            filtered = filtered[filtered['region'].isin(self.selected_regions)]
-        
-        # Apply state filter
-        if self.selected_states:
-            filtered = filtered[filtered['state'].isin(self.selected_states)]
+        filter_key = self._get_filter_key()
         
-        # Apply vehicle type filter
-        if self.selected_vehicle_types:
-            filtered = filtered[filtered['vehicle_type'].isin(self.selected_vehicle_types)]
+        # Reselecting the same values changes neither the rows nor the trained
+        # model, so skip retraining and resending every chart
+        if filter_key == self._filter_key and not self._forecast_dirty:
+            return
+        self._filter_key = filter_key
         
-        # Apply make filter
-        if self.selected_makes:
-            filtered = filtered[filtered['make'].isin(self.selected_makes)]
+        # Filtered rows live in the _filter_frame cache, so only note whether
+        # the selection leaves any
+        self._has_data = not _filter_frame(filter_key).empty
         
-        # Apply model filter
-        if self.selected_models:
-            filtered = filtered[filtered['model'].isin(self.selected_models)]
-        
-        # Apply year filter
-        if self.selected_years:
-            filtered = filtered[filtered['model_year'].isin(self.selected_years)]
-          # Update filtered data
-        self._filtered_df = filtered
-        self.filtered_data = filtered.to_dict("records")
+        # Aggregate the summary table from the same filtered rows
+        self.vehicle_type_summary = _vehicle_type_summary(self._filter_key)
         
         # Update model and forecast after filtering
-        self.train_model()
+        self._update_forecast(retrain=True)
+    
+    def _update_forecast(self, retrain=False):
+        """Refresh the forecast now if a forecast tab is visible, otherwise defer it"""
+        self._forecast_dirty = True
+        if self.active_tab not in FORECAST_TABS:
+            return
+        if retrain:
+            self.train_model()
         self.generate_forecast()
-        
+    
     def train_model(self):
         """Train the forecasting model with filtered data"""
-        # Initialize model based on selected type
-        model_type = "linear" if self.model_type == "Linear Regression" else "forest"
-        self._scenario_engine = ScenarioEngine(model_type=model_type)
-        
-        # Train the model if we have data - safely check if attribute exists and if dataframe is empty
-        try:
-            if hasattr(self, "_filtered_df") and isinstance(self._filtered_df, pd.DataFrame) and not self._filtered_df.empty:
-                self._scenario_engine.train(self._filtered_df)
-        except AttributeError:
-            # Handle case where _filtered_df might not be accessible
-            pass
+        # Trained engines live in the module-level cache keyed by filter
+        # selection and model type rather than on the state, so they are never
+        # serialized with it and toggling back to a selection reuses its engine
+        _train_engine(self._filter_key, self._get_model_type())
     
     def generate_forecast(self):
         """Generate forecast based on selected modifiers"""
-        # Generate forecast if we have data - safely check if attribute exists and if dataframe is empty
+        # Generate forecast if the current filters leave any rows
         try:
-            if hasattr(self, "_filtered_df") and isinstance(self._filtered_df, pd.DataFrame) and not self._filtered_df.empty:
-                # Log the current modifiers being used
-                print(f"Generating forecast with modifiers: unemployment={self.unemployment_modifier}, " 
-                      f"gas_price={self.gas_price_modifier}, cpi={self.cpi_modifier}, "
-                      f"search_volume={self.search_volume_modifier}, months={self.forecast_months}")
-                
-                forecast_df = self._scenario_engine.forecast(
-                    self._filtered_df,
-                    unemployment_modifier=self.unemployment_modifier,
-                    gas_price_modifier=self.gas_price_modifier,
-                    cpi_modifier=self.cpi_modifier,
-                    search_volume_modifier=self.search_volume_modifier,
-                    months_ahead=self.forecast_months
+            if self._has_data:
+                forecast_key = (
+                    self._filter_key,
+                    self._get_model_type(),
+                    self.unemployment_modifier,
+                    self.gas_price_modifier,
+                    self.cpi_modifier,
+                    self.search_volume_modifier,
+                    self.forecast_months
                 )
+                forecast_df = _forecast_frame(*forecast_key)
+                self._forecast_key = forecast_key
                 
                 # Update both the private DataFrame and the public serializable list
                 self._forecast_df = forecast_df
-                self.forecast_data = forecast_df.to_dict("records")
-                
-                # Log success information for debugging
-                print(f"Forecast generated successfully with {len(self.forecast_data)} records")
+                self.forecast_data = forecast_df.to_dict("list")
+                self._forecast_dirty = False
             else:
-                print("Cannot generate forecast: No filtered data available")
+                logger.debug("Cannot generate forecast: No filtered data available")
                 self._forecast_df = pd.DataFrame()
-                self.forecast_data = []
+                self.forecast_data = {}
         except Exception as e:
             # Handle any errors during forecast generation
-            print(f"Error generating forecast: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error generating forecast: %s", e)
             self._forecast_df = pd.DataFrame()
-            self.forecast_data = []
+            self.forecast_data = {}
     
     # Filter update handlers
     def update_regions(self, regions):
@@ -199,12 +474,13 @@ class DashboardState(rx.State):
     def update_years(self, years):
         """Update selected years"""
         # Years are provided as strings from the UI; convert to integers for
-        # filtering against the numeric ``model_year`` column.
+        # filtering against the numeric ``model_year`` column. NumPy parses the
+        # whole selection at once, and ndmin keeps a single year a list.
         try:
-            self.selected_years = [int(y) for y in years]
+            self.selected_years = np.array(years, dtype=np.uint16, ndmin=1).tolist()
         except Exception as e:
             # Handle conversion error, e.g., log or set to empty
-            print(f"Error converting years: {e}")
+            logger.warning("Error converting years: %s", e)
             self.selected_years = []
         self.filter_data()
 
@@ -215,19 +491,15 @@ class DashboardState(rx.State):
         if isinstance(value, list) and len(value) > 0:
             value = float(value[0])
         self.unemployment_modifier = float(value)
-        self.generate_forecast()
+        return self._debounce_forecast()
 
     def update_gas_price(self, value):
         """Update gas price modifier"""
         # Convert value to float if it's a list
         if isinstance(value, list) and len(value) > 0:
             value = float(value[0])
-        value = float(value)
-        print(f"Updating gas price modifier to {value}")
-        self.gas_price_modifier = value
-        # Force forecast regeneration with explicit logging
-        print("Generating new forecast after gas price update")
-        self.generate_forecast()
+        self.gas_price_modifier = float(value)
+        return self._debounce_forecast()
     
     def update_cpi(self, value):
         """Update CPI modifier"""
@@ -235,7 +507,7 @@ class DashboardState(rx.State):
         if isinstance(value, list) and len(value) > 0:
             value = float(value[0])
         self.cpi_modifier = float(value)
-        self.generate_forecast()
+        return self._debounce_forecast()
     
     def update_search_volume(self, value):
         """Update search volume modifier"""
@@ -243,7 +515,7 @@ class DashboardState(rx.State):
         if isinstance(value, list) and len(value) > 0:
             value = float(value[0])
         self.search_volume_modifier = float(value)
-        self.generate_forecast()
+        return self._debounce_forecast()
 
     def update_forecast_months(self, value):
         """Update forecast months"""
@@ -251,43 +523,68 @@ class DashboardState(rx.State):
         if isinstance(value, list) and len(value) > 0:
             value = int(value[0])
         self.forecast_months = int(value)
-        self.generate_forecast()
+        return self._debounce_forecast()
+    
+    def _debounce_forecast(self):
+        """Record a modifier change and schedule a forecast once changes settle"""
+        self._forecast_pending += 1
+        return DashboardState.forecast_when_settled(self._forecast_pending)
+    
+    @rx.event(background=True)
+    async def forecast_when_settled(self, token: int):
+        """Regenerate the forecast if no modifier changed during the debounce window"""
+        await asyncio.sleep(FORECAST_DEBOUNCE_SECONDS)
+        async with self:
+            # A newer slider event scheduled its own run, so leave the work to it
+            if token != self._forecast_pending:
+                return
+            self._update_forecast()
     
     def update_model_type(self, value):
         """Update model type"""
         self.model_type = value
-        self.train_model()
-        self.generate_forecast()
+        self._update_forecast(retrain=True)
     def update_active_tab(self, tab: str):
         """Update the active tab."""
-        print(f"Tab changed to: {tab}")  # Debug print
         self.active_tab = tab
-        # Force re-evaluation of charts for the new tab
-        self.filter_data()
+        # Chart vars are cached and only resent when their data changes,
+        # so switching tabs does not need to filter and forecast again.
+        # Only catch up on a forecast deferred while another tab was showing.
+        if tab in FORECAST_TABS and self._forecast_dirty:
+            self.train_model()
+            self.generate_forecast()
 
     # UI update handlers
     def toggle_table(self, value: bool):
         """Toggle the table visibility in the dashboard UI."""
-        print(f"Toggling table visibility to: {value}")
+        logger.debug("Toggling table visibility to: %s", value)
         self.show_table = value
         # No need to regenerate forecast or filter data, just update the UI state
 
+    @rx.var
+    def filtered_data(self) -> list[dict]:
+        """Get the first filtered rows as records, built only while the table is shown"""
+        if not self.show_table:
+            return []
+        return _to_records(_filter_frame(self._filter_key).head(FILTERED_ROWS_LIMIT))
+
+    @rx.var
+    def forecast_table_rows(self) -> list[dict]:
+        """Get formatted forecast table rows, built only while the table is shown"""
+        if not self.show_table or self._forecast_df.empty:
+            return []
+        return format_forecast_rows(self._forecast_df)
+
     # Chart creation methods - these must be decorated with @rx.var with type annotations    
     @rx.var
     def get_sales_trend_chart(self) -> dict:
         """Get sales trend chart"""
-        # Check if _forecast_df is initialized before using it
-        if hasattr(self, "_forecast_df") and isinstance(self._forecast_df, pd.DataFrame) and not self._forecast_df.empty:
-            # Add debug print
-            print(f"Forecast DF shape: {self._forecast_df.shape}")
-            print(f"Forecast DF columns: {self._forecast_df.columns.tolist()}")
-            print(f"First 3 rows: {self._forecast_df.head(3).to_dict('records')}")
-            
+        if not self._forecast_df.empty:
             # Generate a sample chart if the real one fails
             try:
-                return create_sales_trend_chart(self._forecast_df)
+                return _forecast_chart('sales_trend', self._forecast_key)
             except Exception as e:
-                print(f"Error creating sales trend chart: {str(e)}")
+                logger.exception("Error creating sales trend chart: %s", e)
                 # Create a fallback chart
                 import plotly.graph_objects as go
                 fig = go.Figure()
@@ -300,74 +597,44 @@ class DashboardState(rx.State):
                 )
                 return fig.to_dict()
         else:
-            print("No forecast data available for chart")
             return {}
 
     @rx.var
     def get_vehicle_type_chart(self) -> dict:
         """Get vehicle type chart"""
-        if hasattr(self, "_filtered_df") and isinstance(self._filtered_df, pd.DataFrame) and not self._filtered_df.empty:
-            return create_vehicle_type_chart(self._filtered_df)
-        else:
-            return {}
+        return _filtered_chart('vehicle_type', self._filter_key)
     
     @rx.var
     def get_region_chart(self) -> dict:
         """Get region chart"""
-        if hasattr(self, "_filtered_df") and isinstance(self._filtered_df, pd.DataFrame) and not self._filtered_df.empty:
-            return create_region_chart(self._filtered_df)
-        else:
-            return {}
+        return _filtered_chart('region', self._filter_key)
 
     @rx.var
     def get_exogenous_impact_chart(self) -> dict:
         """Get exogenous impact chart"""
-        if hasattr(self, "_forecast_df") and isinstance(self._forecast_df, pd.DataFrame) and not self._forecast_df.empty:
-            return create_exogenous_impact_chart(self._forecast_df)
-        else:
+        if self._forecast_df.empty:
             return {}
+        return _forecast_chart('exogenous_impact', self._forecast_key)
     
     @rx.var
     def get_exogenous_figure(self) -> go.Figure:
         """Get exogenous variable chart as a Plotly Figure."""
-        print(f"get_exogenous_figure with gas_price={self.gas_price_modifier}")
-        return create_exogenous_figure(
-            "Exogenous Variable Trends",
-            self.forecast_data
-        )
-
-
-    # @rx.var
-    # def get_exogenous_variable_chart(self) -> rx.Component:
-    #     """Get exogenous variable chart - returns a component for direct use in UI"""
-    #     print(f"Creating exogenous variable chart with gas_price={self.gas_price_modifier}")
-    #     # Use directly in UI - returns the component, not just the figure data
-    #     return create_exogenous_chart(
-    #         "Exogenous Variable Trends",
-    #         self.forecast_data,  # This is a Var and will trigger updates when it changes
-    #         height="500px"
-    #     )
+        # Without a forecast the figure falls back to sample data
+        if self._forecast_df.empty:
+            return create_exogenous_figure("Exogenous Variable Trends", self._forecast_df)
+        return _exogenous_figure(self._forecast_key)
     
     @rx.var
     def get_top_models_chart(self) -> dict:
         """Get top models chart"""
-        if hasattr(self, "_filtered_df") and isinstance(self._filtered_df, pd.DataFrame) and not self._filtered_df.empty:
-            return create_top_models_chart(self._filtered_df)
-        else:
-            return {}
+        return _filtered_chart('top_models', self._filter_key)
     
     @rx.var
     def get_state_map_chart(self) -> dict:
         """Get state map chart"""
-        if hasattr(self, "_filtered_df") and isinstance(self._filtered_df, pd.DataFrame) and not self._filtered_df.empty:
-            return create_state_map_chart(self._filtered_df)
-        else:
-            return {}
+        return _filtered_chart('state_map', self._filter_key)
     
     @rx.var
     def get_sales_by_month_chart(self) -> dict:
         """Get sales by month heatmap"""
-        if hasattr(self, "_filtered_df") and isinstance(self._filtered_df, pd.DataFrame) and not self._filtered_df.empty:
-            return create_heatmap_chart(self._filtered_df, x_col='month', y_col='vehicle_type')
-        else:
-            return {}
+        return _filtered_chart('sales_by_month', self._filter_key)